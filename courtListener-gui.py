@@ -3,18 +3,39 @@
 import sys
 import os
 import csv
+import json
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                            QLabel, QLineEdit, QComboBox, QPushButton, QTableWidget,
-                            QTableWidgetItem, QDateEdit, QSpinBox, QCheckBox, QFileDialog,
+                            QLabel, QLineEdit, QComboBox, QPushButton, QTableView,
+                            QDateEdit, QSpinBox, QCheckBox, QFileDialog,
                             QTabWidget, QMessageBox, QGroupBox, QStatusBar, QHeaderView,
-                            QSplitter, QFrame, QSizePolicy)
-from PyQt5.QtCore import Qt, QDate
-from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QPixmap
+                            QSplitter, QFrame, QSizePolicy, QCompleter)
+from PyQt5.QtCore import (Qt, QDate, QAbstractTableModel, QModelIndex, QObject, QThread,
+                          QThreadPool, QRunnable, QMutex, QMutexLocker, QStandardPaths,
+                          pyqtSignal)
+from PyQt5.QtGui import (QFont, QIcon, QColor, QPalette, QPixmap, QStandardItemModel,
+                         QStandardItem)
 
-API_BASE = "https://www.courtlistener.com/api/rest/v4"
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+CL_BASE = "https://www.courtlistener.com"
+API_BASE = CL_BASE + "/api/rest/v4"
 API_TOKEN = ""
 
 HEADERS = {
@@ -22,6 +43,34 @@ HEADERS = {
     "Authorization": f"Token {API_TOKEN}",
 }
 
+REQUEST_TIMEOUT = (3.05, 15)
+COURT_CACHE_TTL = 30 * 86400
+
+if requests_cache is not None:
+    SESSION = requests_cache.CachedSession(
+        cache_name=os.path.expanduser("~/.courtlistener_cache"),
+        backend="sqlite",
+        expire_after=3600,
+        urls_expire_after={"*/api/rest/v4/courts/*": COURT_CACHE_TTL},
+        allowable_methods=("GET",),
+        cache_control=True,
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+COURT_LOOKUP_WORKERS = 8
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=2 * COURT_LOOKUP_WORKERS + 1,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+    ),
+))
+
 POPULAR_COURTS = [
     ("", "All Courts"),
     ("scotus", "Supreme Court of the United States"),
@@ -36,7 +85,150 @@ POPULAR_COURTS = [
     ("cacd", "U.S. District Court for the Central District of California"),
 ]
 
+COURTS_SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "courts.json")
+
 court_cache: Dict[str, str] = {}
+court_fetch_info: Dict[str, Tuple[Optional[str], float]] = {}
+stale_courts: Dict[str, str] = {}
+try:
+    with open(COURTS_SNAPSHOT, encoding="utf-8") as f:
+        court_cache.update(json.load(f))
+except (OSError, ValueError):
+    pass
+
+def court_cache_path() -> str:
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), "court_cache.json")
+
+def load_court_cache():
+    with open(court_cache_path(), encoding="utf-8") as f:
+        entries = json.load(f)
+    now = time.time()
+    for court_ref, entry in entries.items():
+        if isinstance(entry, str):
+            court_cache[court_ref] = entry
+            continue
+        court_fetch_info[court_ref] = (entry.get("etag"), entry.get("fetched", 0))
+        if now - entry.get("fetched", 0) < COURT_CACHE_TTL:
+            court_cache[court_ref] = entry["name"]
+        else:
+            stale_courts[court_ref] = entry["name"]
+
+def save_court_cache():
+    entries = {}
+    for court_ref, name in list(stale_courts.items()) + list(court_cache.items()):
+        if court_ref in court_fetch_info:
+            etag, fetched = court_fetch_info[court_ref]
+            entries[court_ref] = {"name": name, "etag": etag, "fetched": fetched}
+        else:
+            entries[court_ref] = name
+    path = court_cache_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+
+STYLE = """
+    QMainWindow {
+        background-color: #121212;
+        color: #E0E0E0;
+    }
+    QTabWidget::pane {
+        border: 1px solid #424242;
+        background-color: #212121;
+        border-radius: 4px;
+    }
+    QTabBar::tab {
+        background-color: #323232;
+        color: #E0E0E0;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background-color: #212121;
+        border: 1px solid #424242;
+        border-bottom-color: #212121;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #424242;
+        border-radius: 4px;
+        margin-top: 1.5ex;
+        color: #E0E0E0;
+        background-color: #212121;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 5px;
+        background-color: #212121;
+    }
+    QLineEdit, QComboBox, QDateEdit, QSpinBox {
+        padding: 6px;
+        border: 1px solid #424242;
+        border-radius: 4px;
+        background-color: #323232;
+        color: #E0E0E0;
+    }
+    QComboBox::drop-down {
+        border: 0px;
+    }
+    QComboBox::down-arrow {
+        background-color: #323232;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #323232;
+        color: #E0E0E0;
+        selection-background-color: #424242;
+    }
+    QCheckBox {
+        color: #E0E0E0;
+    }
+    QCheckBox::indicator {
+        border: 1px solid #424242;
+        background: #323232;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #2196F3;
+    }
+    QLineEdit:focus, QComboBox:focus, QDateEdit:focus, QSpinBox:focus {
+        border: 1px solid #2196F3;
+    }
+    QTableView {
+        border: none;
+        gridline-color: #424242;
+        border-radius: 4px;
+        background-color: #212121;
+        color: #E0E0E0;
+    }
+    QHeaderView::section {
+        background-color: #323232;
+        padding: 6px;
+        border: none;
+        border-right: 1px solid #424242;
+        font-weight: bold;
+        color: #E0E0E0;
+    }
+    QTableView#results_table::item {
+        background-color: #212121;
+    }
+    QTableView#results_table::item:selected {
+        background-color: #1565C0;
+        color: white;
+    }
+    QStatusBar {
+        background-color: #323232;
+        color: #E0E0E0;
+    }
+    QLabel {
+        color: #E0E0E0;
+    }
+    QToolTip {
+        background-color: #323232;
+        color: #E0E0E0;
+        border: 1px solid #424242;
+    }
+"""
 
 class StyledButton(QPushButton):
     def __init__(self, text, color="#1E88E5", parent=None):
@@ -62,107 +254,223 @@ class StyledButton(QPushButton):
         """)
         self.setCursor(Qt.PointingHandCursor)
 
+CSV_HEADERS = ("case_name", "court", "date_filed", "url", "docket_number", "citation")
+
+def format_citation(citation) -> str:
+    if isinstance(citation, list):
+        return ", ".join(str(c) for c in citation if c)
+    return str(citation) if citation else ""
+
+def opinion_row(item: Dict, court: str) -> tuple:
+    docket = item.get("docket_number", "")
+    citation_str = item.get("_citation_str")
+    if citation_str is None:
+        citation_str = format_citation(item.get("citation"))
+    case_name = item.get("case_name", "Unknown Case")
+    date_filed = item.get("date_filed", "Unknown Date")
+    return (
+        "" if case_name is None else case_name,
+        court,
+        "" if date_filed is None else date_filed,
+        CL_BASE + (item.get("absolute_url") or ""),
+        str(docket) if docket else "",
+        citation_str,
+    )
+
+class CourtLookupSignals(QObject):
+    done = pyqtSignal(str, str)
+
+class CourtLookup(QRunnable):
+    def __init__(self, court_ref: str, fetch_court):
+        super().__init__()
+        self.court_ref = court_ref
+        self.signals = CourtLookupSignals()
+        self._fetch_court = fetch_court
+
+    def run(self):
+        self.signals.done.emit(self.court_ref, self._fetch_court(self.court_ref))
+
+class OpinionsModel(QAbstractTableModel):
+    HEADERS = ["Case Name", "Court", "Date Filed", "URL", "Docket Number", "Citation"]
+    COURT_COLUMN = 1
+    URL_COLUMN = 3
+
+    def __init__(self, resolve_court, fetch_court, parent=None):
+        super().__init__(parent)
+        self._rows: List[list] = []
+        self._court_refs: List = []
+        self._pending = set()
+        self._resolve_court = resolve_court
+        self._fetch_court = fetch_court
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(COURT_LOOKUP_WORKERS)
+
+    def set_rows(self, results: List[Dict]):
+        rows = []
+        court_refs = []
+        for item in results:
+            court_ref = item.get("court")
+            if isinstance(court_ref, str) and court_ref.startswith("/api/") and court_ref not in court_cache:
+                court = None
+            else:
+                court = self._resolve_court(court_ref)
+            rows.append(list(opinion_row(item, court)))
+            court_refs.append(court_ref)
+
+        self.beginResetModel()
+        self._rows = rows
+        self._court_refs = court_refs
+        self.endResetModel()
+
+    def _request_court(self, court_ref: str):
+        if court_ref in self._pending:
+            return
+        self._pending.add(court_ref)
+        lookup = CourtLookup(court_ref, self._fetch_court)
+        lookup.signals.done.connect(self._court_resolved)
+        self._pool.start(lookup)
+
+    def _court_resolved(self, court_ref: str, name: str):
+        self._pending.discard(court_ref)
+        for row, ref in enumerate(self._court_refs):
+            if ref == court_ref and self._rows[row][self.COURT_COLUMN] is None:
+                self._rows[row][self.COURT_COLUMN] = name
+                index = self.index(row, self.COURT_COLUMN)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._rows[index.row()][index.column()]
+            if value is None and index.column() == self.COURT_COLUMN:
+                self._request_court(self._court_refs[index.row()])
+                return "Loading…"
+            return value
+        if role == Qt.UserRole and index.column() == self.URL_COLUMN:
+            return self._rows[index.row()][self.URL_COLUMN]
+        return None
+
+class FetchWorker(QObject):
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)
+
+    def __init__(self, url: str, params: Dict[str, Union[str, int]], parent=None):
+        super().__init__(parent)
+        self.url = url
+        self.params = params
+        self._cancelled = False
+        self._mutex = QMutex()
+
+    def cancel(self):
+        with QMutexLocker(self._mutex):
+            self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        with QMutexLocker(self._mutex):
+            return self._cancelled
+
+    def run(self):
+        all_results = []
+        params = dict(self.params)
+        max_results = params.get("page_size", 20)
+        
+        original_page_size = params.get("page_size", 20)
+        
+        per_page = min(max_results, 100)
+        params["page_size"] = per_page
+        
+        pages_needed = (max_results + per_page - 1) // per_page
+        
+        try:
+            next_url = self.url
+            page = 1
+            
+            while next_url and len(all_results) < max_results:
+                if self.is_cancelled():
+                    break
+                self.progress.emit(page, pages_needed)
+                
+                if page > 1:
+                    response = SESSION.get(next_url, timeout=REQUEST_TIMEOUT)
+                else:
+                    response = SESSION.get(self.url, params=params, timeout=REQUEST_TIMEOUT)
+                
+                response.raise_for_status()
+                json_response = json_loads(response.content)
+                
+                page_results = json_response.get("results", [])
+                all_results.extend(page_results)
+                
+                next_url = json_response.get("next")
+                page += 1
+            
+        except requests.ConnectionError:
+            self.error.emit("Connection error: Unable to reach the API.")
+        except requests.Timeout:
+            self.error.emit("Request timed out: API took too long to respond.")
+        except requests.HTTPError as e:
+            self.error.emit(f"HTTP error: {e.response.status_code} - {e.response.reason}")
+        except (requests.RequestException, ValueError) as e:
+            self.error.emit(f"API error: {e}")
+            
+        all_results = all_results[:original_page_size]
+        for item in all_results:
+            item["_citation_str"] = format_citation(item.get("citation"))
+        self.finished.emit(all_results)
+
+class ExportWorker(QObject):
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, results: List[Dict], file_name: str, resolve_court, prefetch_courts, parent=None):
+        super().__init__(parent)
+        self.results = results
+        self.file_name = file_name
+        self._resolve_court = resolve_court
+        self._prefetch_courts = prefetch_courts
+
+    def run(self):
+        try:
+            self._prefetch_courts(self.results)
+            rows = [opinion_row(item, self._resolve_court(item.get("court"))) for item in self.results]
+            with open(self.file_name, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADERS)
+                writer.writerows(rows)
+        except IOError as e:
+            self.error.emit(f"Error writing to CSV: {e}")
+            return
+        except Exception as e:
+            self.error.emit(f"Error exporting results: {e}")
+            return
+        self.finished.emit(self.file_name)
+
 class CourtListenerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.init_ui()
         self.search_results = []
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #121212;
-                color: #E0E0E0;
-            }
-            QTabWidget::pane {
-                border: 1px solid #424242;
-                background-color: #212121;
-                border-radius: 4px;
-            }
-            QTabBar::tab {
-                background-color: #323232;
-                color: #E0E0E0;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #212121;
-                border: 1px solid #424242;
-                border-bottom-color: #212121;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #424242;
-                border-radius: 4px;
-                margin-top: 1.5ex;
-                color: #E0E0E0;
-                background-color: #212121;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-                background-color: #212121;
-            }
-            QLineEdit, QComboBox, QDateEdit, QSpinBox {
-                padding: 6px;
-                border: 1px solid #424242;
-                border-radius: 4px;
-                background-color: #323232;
-                color: #E0E0E0;
-            }
-            QComboBox::drop-down {
-                border: 0px;
-            }
-            QComboBox::down-arrow {
-                background-color: #323232;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #323232;
-                color: #E0E0E0;
-                selection-background-color: #424242;
-            }
-            QCheckBox {
-                color: #E0E0E0;
-            }
-            QCheckBox::indicator {
-                border: 1px solid #424242;
-                background: #323232;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #2196F3;
-            }
-            QLineEdit:focus, QComboBox:focus, QDateEdit:focus, QSpinBox:focus {
-                border: 1px solid #2196F3;
-            }
-            QTableWidget {
-                border: none;
-                gridline-color: #424242;
-                border-radius: 4px;
-                background-color: #212121;
-                color: #E0E0E0;
-            }
-            QHeaderView::section {
-                background-color: #323232;
-                padding: 6px;
-                border: none;
-                border-right: 1px solid #424242;
-                font-weight: bold;
-                color: #E0E0E0;
-            }
-            QStatusBar {
-                background-color: #323232;
-                color: #E0E0E0;
-            }
-            QLabel {
-                color: #E0E0E0;
-            }
-            QToolTip {
-                background-color: #323232;
-                color: #E0E0E0;
-                border: 1px solid #424242;
-            }
-        """)
+        self.fetch_thread = None
+        self.fetch_worker = None
+        self.export_thread = None
+        self.export_worker = None
+        try:
+            load_court_cache()
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
         
     def init_ui(self):
         self.setWindowTitle("CourtListener Search Tool")
@@ -209,9 +517,22 @@ class CourtListenerGUI(QMainWindow):
         court_layout = QHBoxLayout()
         court_label = QLabel("Court:")
         court_label.setMinimumWidth(100)
-        self.court_combo = QComboBox()
+        court_model = QStandardItemModel(self)
+        court_items = []
         for slug, name in POPULAR_COURTS:
-            self.court_combo.addItem(name, slug)
+            court_item = QStandardItem(name)
+            court_item.setData(slug, Qt.UserRole)
+            court_items.append(court_item)
+        court_model.invisibleRootItem().appendRows(court_items)
+        self.court_combo = QComboBox()
+        self.court_combo.setEditable(True)
+        self.court_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.court_combo.setModel(court_model)
+        court_completer = QCompleter(court_model, self.court_combo)
+        court_completer.setFilterMode(Qt.MatchContains)
+        court_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        court_completer.setCompletionMode(QCompleter.PopupCompletion)
+        self.court_combo.setCompleter(court_completer)
         court_layout.addWidget(court_label)
         court_layout.addWidget(self.court_combo)
         query_layout.addLayout(court_layout)
@@ -274,26 +595,14 @@ class CourtListenerGUI(QMainWindow):
         results_layout = QVBoxLayout(results_group)
         results_layout.setContentsMargins(10, 20, 10, 10)
         
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels(["Case Name", "Court", "Date Filed", "URL", "Docket Number", "Citation"])
-        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.results_model = OpinionsModel(self.resolve_court_name, self._fetch_court_name, self)
+        self.results_table = QTableView()
+        self.results_table.setObjectName("results_table")
+        self.results_table.setModel(self.results_model)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.results_table.setSelectionBehavior(QTableView.SelectRows)
         self.results_table.setAlternatingRowColors(False)
-        self.results_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #212121;
-                color: #E0E0E0;
-            }
-            QTableWidget::item {
-                background-color: #212121;
-            }
-            QTableWidget::item:selected {
-                background-color: #1565C0;
-                color: white;
-            }
-        """)
         
         results_layout.addWidget(self.results_table)
         search_layout.addWidget(results_group)
@@ -347,10 +656,24 @@ class CourtListenerGUI(QMainWindow):
         self.progress_label = QLabel("")
         self.status_bar.addPermanentWidget(self.progress_label)
         
+    def closeEvent(self, event):
+        if self.fetch_thread is not None:
+            self.fetch_worker.cancel()
+            self.fetch_thread.quit()
+            self.fetch_thread.wait()
+        if self.export_thread is not None:
+            self.export_thread.quit()
+            self.export_thread.wait()
+        try:
+            save_court_cache()
+        except OSError:
+            pass
+        super().closeEvent(event)
+        
     def save_api_token(self):
-        global API_TOKEN, HEADERS
+        global API_TOKEN
         API_TOKEN = self.token_input.text()
-        HEADERS["Authorization"] = f"Token {API_TOKEN}"
+        SESSION.headers["Authorization"] = f"Token {API_TOKEN}"
         QMessageBox.information(self, "Settings", "API Token saved successfully")
         
     def validate_date(self, date_str: str) -> bool:
@@ -367,85 +690,46 @@ class CourtListenerGUI(QMainWindow):
         if isinstance(court_ref, str) and court_ref.startswith("/api/"):
             if court_ref in court_cache:
                 return court_cache[court_ref]
-
-            court_url = f"https://www.courtlistener.com{court_ref}"
-            try:
-                response = requests.get(court_url, headers=HEADERS, timeout=10)
-                response.raise_for_status()
-                name = response.json().get("name", court_ref.split("/")[-2])
-                court_cache[court_ref] = name
-                return name
-            except requests.RequestException:
-                return court_ref.split("/")[-2]
+            return self._fetch_court_name(court_ref)
 
         return court_ref or "Unknown Court"
 
-    def fetch_opinions(self, url: str, params: Dict[str, Union[str, int]]) -> List[Dict]:
-        self.status_bar.showMessage("Fetching opinions...")
-        all_results = []
-        max_results = params.get("page_size", 20)
-        
-        original_page_size = params.get("page_size", 20)
-        
-        per_page = 20
-        params["page_size"] = per_page
-        
-        pages_needed = (max_results + per_page - 1) // per_page
-        
+    def _fetch_court_name(self, court_ref: str) -> str:
+        court_url = CL_BASE + court_ref
+        etag = court_fetch_info.get(court_ref, (None, 0))[0]
+        headers = {"If-None-Match": etag} if etag and court_ref in stale_courts else {}
         try:
-            next_url = url
-            page = 1
-            
-            while next_url and len(all_results) < max_results and page <= pages_needed:
-                self.status_bar.showMessage(f"Fetching page {page}...")
-                self.progress_label.setText(f"Page {page}/{pages_needed}")
-                
-                if page > 1:
-                    response = requests.get(next_url, headers=HEADERS, timeout=15)
-                else:
-                    response = requests.get(url, headers=HEADERS, params=params, timeout=15)
-                
-                response.raise_for_status()
-                json_response = response.json()
-                
-                page_results = json_response.get("results", [])
-                all_results.extend(page_results)
-                
-                next_url = json_response.get("next")
-                page += 1
-                
-                if next_url and len(all_results) < max_results:
-                    self.status_bar.showMessage(f"Fetched {len(all_results)} results so far...")
-                    QApplication.processEvents()
-            
-            all_results = all_results[:original_page_size]
-            
-            self.status_bar.showMessage(f"Fetched {len(all_results)} opinions successfully")
-            self.progress_label.setText("")
-            return all_results
-            
-        except requests.ConnectionError:
-            self.status_bar.showMessage("Connection error: Unable to reach the API.")
-            self.progress_label.setText("")
-            return all_results
-        except requests.Timeout:
-            self.status_bar.showMessage("Request timed out: API took too long to respond.")
-            self.progress_label.setText("")
-            return all_results
-        except requests.HTTPError as e:
-            self.status_bar.showMessage(f"HTTP error: {e.response.status_code} - {e.response.reason}")
-            self.progress_label.setText("")
-            return all_results
-        except requests.RequestException as e:
-            self.status_bar.showMessage(f"API error: {e}")
-            self.progress_label.setText("")
-            return all_results
+            response = SESSION.get(court_url, headers=headers, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            if response.status_code == 304:
+                name = stale_courts.get(court_ref, court_ref.split("/")[-2])
+            else:
+                name = json_loads(response.content).get("name", court_ref.split("/")[-2])
+                etag = response.headers.get("ETag")
+            court_cache[court_ref] = name
+            court_fetch_info[court_ref] = (etag, time.time())
+            stale_courts.pop(court_ref, None)
+            return name
+        except (requests.RequestException, ValueError):
+            return stale_courts.get(court_ref, court_ref.split("/")[-2])
+
+    def prefetch_court_names(self, results: List[Dict]):
+        refs = {
+            item["court"] for item in results
+            if isinstance(item.get("court"), str)
+            and item["court"].startswith("/api/")
+            and item["court"] not in court_cache
+        }
+        if not refs:
+            return
+        with ThreadPoolExecutor(max_workers=COURT_LOOKUP_WORKERS) as executor:
+            list(executor.map(self._fetch_court_name, refs))
 
     def display_results(self, results: List[Dict]):
         self.search_results = results
-        self.results_table.setRowCount(0)
         
         if not results:
+            self.results_model.set_rows([])
             self.status_bar.showMessage("No results found")
             self.export_button.setEnabled(False)
             return
@@ -453,38 +737,66 @@ class CourtListenerGUI(QMainWindow):
         self.status_bar.showMessage(f"Found {len(results)} result(s)")
         self.export_button.setEnabled(True)
         
-        for row, item in enumerate(results):
-            self.results_table.insertRow(row)
-            
-            case_name = item.get("case_name", "Unknown Case")
-            court = self.resolve_court_name(item.get("court"))
-            date_filed = item.get("date_filed", "Unknown Date")
-            absolute_url = item.get("absolute_url", "")
-            link = f"https://www.courtlistener.com{absolute_url}"
-            docket = item.get("docket_number", "")
-            citation = item.get("citation", "")
-            
-            case_item = QTableWidgetItem(case_name)
-            court_item = QTableWidgetItem(court)
-            date_item = QTableWidgetItem(date_filed)
-            url_item = QTableWidgetItem(link)
-            url_item.setData(Qt.UserRole, link)
-            docket_item = QTableWidgetItem(str(docket) if docket else "")
-            
-            if isinstance(citation, list):
-                citation_str = ", ".join(str(c) for c in citation if c)
-            else:
-                citation_str = str(citation) if citation else ""
-            citation_item = QTableWidgetItem(citation_str)
+        self.results_table.setUpdatesEnabled(False)
+        self.results_table.setSortingEnabled(False)
+        try:
+            self.results_model.set_rows(results)
+            self.results_table.resizeColumnsToContents()
+        finally:
+            self.results_table.setUpdatesEnabled(True)
+
+    def start_fetch(self, url: str, params: Dict[str, Union[str, int]]):
+        self.status_bar.showMessage("Fetching opinions...")
+        self.search_button.setText("Cancel")
+        self.current_button.setEnabled(False)
+        
+        self.fetch_thread = QThread(self)
+        self.fetch_worker = FetchWorker(url, params)
+        self.fetch_worker.moveToThread(self.fetch_thread)
+        self.fetch_thread.started.connect(self.fetch_worker.run)
+        self.fetch_worker.error.connect(self.status_bar.showMessage)
+        self.fetch_worker.progress.connect(self.on_fetch_progress)
+        self.fetch_worker.finished.connect(self.on_fetch_finished)
+        self.fetch_worker.finished.connect(self.fetch_thread.quit)
+        self.fetch_worker.finished.connect(self.fetch_worker.deleteLater)
+        self.fetch_thread.finished.connect(self.fetch_thread.deleteLater)
+        self.fetch_thread.start()
+        
+    def on_fetch_progress(self, page: int, pages_needed: int):
+        self.status_bar.showMessage(f"Fetching page {page}...")
+        self.progress_label.setText(f"Page {page}/{max(page, pages_needed)}")
+        
+    def cancel_fetch(self):
+        if self.fetch_worker is not None:
+            self.fetch_worker.cancel()
+            self.status_bar.showMessage("Cancelling...")
             
-            self.results_table.setItem(row, 0, case_item)
-            self.results_table.setItem(row, 1, court_item)
-            self.results_table.setItem(row, 2, date_item)
-            self.results_table.setItem(row, 3, url_item)
-            self.results_table.setItem(row, 4, docket_item)
-            self.results_table.setItem(row, 5, citation_item)
+    def on_fetch_finished(self, results: List[Dict]):
+        self.fetch_worker = None
+        self.fetch_thread = None
+        self.search_button.setText("Search Opinions")
+        self.current_button.setEnabled(True)
+        self.progress_label.setText("")
+        self.display_results(results)
+
+    def selected_court_slug(self) -> Optional[str]:
+        text = self.court_combo.currentText().strip()
+        if not text:
+            return ""
+        index = self.court_combo.findText(text, Qt.MatchFixedString)
+        if index < 0:
+            index = self.court_combo.findData(text.lower())
+        if index < 0:
+            QMessageBox.warning(self, "Input Error", f"Unknown court: {text}")
+            return None
+        self.court_combo.setCurrentIndex(index)
+        return self.court_combo.itemData(index)
 
     def search_opinions(self):
+        if self.fetch_worker is not None:
+            self.cancel_fetch()
+            return
+            
         query = self.query_input.text()
         if not query:
             QMessageBox.warning(self, "Input Error", "Please enter a search query")
@@ -497,7 +809,9 @@ class CourtListenerGUI(QMainWindow):
             "page_size": self.limit_spin.value(),
         }
         
-        court_slug = self.court_combo.currentData()
+        court_slug = self.selected_court_slug()
+        if court_slug is None:
+            return
         if court_slug:
             params["court"] = court_slug
             
@@ -507,8 +821,7 @@ class CourtListenerGUI(QMainWindow):
             params["date_filed__gte"] = start_date
             params["date_filed__lte"] = end_date
             
-        results = self.fetch_opinions(search_url, params)
-        self.display_results(results)
+        self.start_fetch(search_url, params)
 
     def fetch_current_opinions(self):
         search_url = f"{API_BASE}/opinions/"
@@ -516,7 +829,9 @@ class CourtListenerGUI(QMainWindow):
             "page_size": self.limit_spin.value(),
         }
         
-        court_slug = self.court_combo.currentData()
+        court_slug = self.selected_court_slug()
+        if court_slug is None:
+            return
         if court_slug:
             params["court__id"] = court_slug
             
@@ -529,8 +844,7 @@ class CourtListenerGUI(QMainWindow):
             today = datetime.now().strftime("%Y-%m-%d")
             params["date_filed__gte"] = today
             
-        results = self.fetch_opinions(search_url, params)
-        self.display_results(results)
+        self.start_fetch(search_url, params)
 
     def export_results(self):
         if not self.search_results:
@@ -541,43 +855,42 @@ class CourtListenerGUI(QMainWindow):
         if not file_name:
             return
             
-        try:
-            with open(file_name, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=["case_name", "court", "date_filed", "url", "docket_number", "citation"],
-                    extrasaction="ignore",
-                )
-                writer.writeheader()
-                for item in self.search_results:
-                    court = self.resolve_court_name(item.get("court"))
-                    absolute_url = item.get("absolute_url", "")
-                    url = f"https://www.courtlistener.com{absolute_url}"
-                    citation = item.get("citation", "")
-                    
-                    if isinstance(citation, list):
-                        citation_str = ", ".join(str(c) for c in citation if c)
-                    else:
-                        citation_str = str(citation) if citation else ""
-                        
-                    writer.writerow({
-                        "case_name": item.get("case_name", "Unknown Case"),
-                        "court": court,
-                        "date_filed": item.get("date_filed", "Unknown Date"),
-                        "url": url,
-                        "docket_number": item.get("docket_number", ""),
-                        "citation": citation_str,
-                    })
-            self.status_bar.showMessage(f"Results exported to {file_name}")
-            QMessageBox.information(self, "Export Successful", f"Results exported to {file_name}")
-        except IOError as e:
-            self.status_bar.showMessage(f"Error writing to CSV: {e}")
-            QMessageBox.critical(self, "Export Error", f"Error writing to CSV: {e}")
-
+        self.status_bar.showMessage("Exporting results...")
+        self.export_button.setEnabled(False)
+        
+        self.export_thread = QThread(self)
+        self.export_worker = ExportWorker(
+            self.search_results, file_name, self.resolve_court_name, self.prefetch_court_names
+        )
+        self.export_worker.moveToThread(self.export_thread)
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.error.connect(self.on_export_error)
+        for signal in (self.export_worker.finished, self.export_worker.error):
+            signal.connect(self.export_thread.quit)
+            signal.connect(self.export_worker.deleteLater)
+        self.export_thread.finished.connect(self.export_thread.deleteLater)
+        self.export_thread.start()
+        
+    def on_export_finished(self, file_name: str):
+        self.export_worker = None
+        self.export_thread = None
+        self.export_button.setEnabled(True)
+        self.status_bar.showMessage(f"Results exported to {file_name}")
+        QMessageBox.information(self, "Export Successful", f"Results exported to {file_name}")
+        
+    def on_export_error(self, message: str):
+        self.export_worker = None
+        self.export_thread = None
+        self.export_button.setEnabled(True)
+        self.status_bar.showMessage(message)
+        QMessageBox.critical(self, "Export Error", message)
 
 def main():
     app = QApplication(sys.argv)
+    app.setApplicationName("CourtListenerGUI")
     app.setStyle("Fusion")
+    app.setStyleSheet(STYLE)
     window = CourtListenerGUI()
     window.show()
     sys.exit(app.exec_())
@@ -1,17 +1,40 @@
 #!/usr/bin/env python3
 # Authored by Michael Mendy
 
-import argparse
+import atexit
+import calendar
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
-import csv
 import os
-from typing import Union, Dict, Optional, List
+import re
+from operator import itemgetter
+from itertools import chain, islice
+from contextlib import ExitStack, contextmanager
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Union, Dict, Optional, List, Iterable, Iterator, Deque, Tuple, OrderedDict as OrderedDictType
 from datetime import datetime
+from types import SimpleNamespace
 from rich.console import Console
 from rich.table import Table
 
-API_BASE = "https://www.courtlistener.com/api/rest/v4"
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+CL_BASE = "https://www.courtlistener.com"
+API_BASE = CL_BASE + "/api/rest/v4"
 API_TOKEN = "" # your CourtListener or Thomson Reuters API token here.
 
 HEADERS = {
@@ -19,42 +42,264 @@ HEADERS = {
     "Authorization": f"Token {API_TOKEN}",
 }
 
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+COURT_LOOKUP_WORKERS = 10
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=COURT_LOOKUP_WORKERS + 2,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
+MAX_PAGE_SIZE = 100
+
+RATE_LIMIT_REQUESTS = 5
+RATE_LIMIT_WINDOW = 1.0
+RATE_LIMIT_LOW_WATER = 2
+RATE_LIMIT_RETRIES = 4
+
+_DATE_RE = re.compile(r"(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])")
+
+CSV_FIELDS = ("case_name", "court", "date_filed", "url", "docket_number", "citation")
+CSV_ROW = itemgetter(*CSV_FIELDS)
+
+COURT_CACHE_PATH = os.path.expanduser("~/.cache/courtlistener/courts.json")
+COURT_CACHE_TTL = 30 * 86400
+COURT_CACHE_SIZE = 4096
+
 console = Console()
-court_cache: Dict[str, str] = {}
+court_cache: OrderedDictType[str, str] = OrderedDict()
+court_fetch_info: Dict[str, Tuple[Optional[str], float]] = {}
+stale_courts: Dict[str, str] = {}
+_courts_primed = False
+_court_cache_loaded = False
+_court_cache_dirty = False
+_request_times: Deque[float] = deque()
+_rate_lock = threading.Lock()
+
+
+def _cache_court(court_ref: str, name: str) -> None:
+    """Store a court name, evicting the least recently used entries past COURT_CACHE_SIZE."""
+    global _court_cache_dirty
+    _court_cache_dirty = True
+    court_cache[court_ref] = name
+    court_cache.move_to_end(court_ref)
+    while len(court_cache) > COURT_CACHE_SIZE:
+        evicted, _ = court_cache.popitem(last=False)
+        court_fetch_info.pop(evicted, None)
+
+
+def load_court_cache() -> None:
+    """Load court names saved by a previous run into court_cache, once per run.
+
+    It is called on the first court cache miss, so runs that never look up a
+    court skip reading the file, and registers save_court_cache at exit.
+    Entries older than COURT_CACHE_TTL go to stale_courts instead. The next
+    lookup revalidates one with If-None-Match when it has an ETag; entries
+    that came from the bulk court list are refreshed by fetching it again.
+    """
+    global _court_cache_loaded, _court_cache_dirty
+    if _court_cache_loaded:
+        return
+    _court_cache_loaded = True
+    atexit.register(save_court_cache)
+
+    try:
+        with open(COURT_CACHE_PATH, encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return
+    if not isinstance(entries, dict):
+        return
+
+    now = time.time()
+    for court_ref, entry in entries.items():
+        if isinstance(entry, str):
+            _cache_court(court_ref, entry)
+            continue
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+            continue
+        fetched = entry.get("fetched", 0)
+        if not isinstance(fetched, (int, float)):
+            fetched = 0
+        court_fetch_info[court_ref] = (entry.get("etag"), fetched)
+        if now - fetched < COURT_CACHE_TTL:
+            _cache_court(court_ref, entry["name"])
+        else:
+            stale_courts[court_ref] = entry["name"]
+    _court_cache_dirty = False
+
+
+def save_court_cache() -> None:
+    """Save court_cache, with ETags and fetch times, so later runs can skip court lookups.
+
+    Nothing is written unless a court was fetched or revalidated this run.
+    """
+    if not _court_cache_dirty:
+        return
+    entries = {}
+    for court_ref, name in list(stale_courts.items()) + list(court_cache.items()):
+        if court_ref in court_fetch_info:
+            etag, fetched = court_fetch_info[court_ref]
+            entries[court_ref] = {"name": name, "etag": etag, "fetched": fetched}
+        else:
+            entries[court_ref] = name
+    try:
+        os.makedirs(os.path.dirname(COURT_CACHE_PATH), exist_ok=True)
+        with open(COURT_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+    except OSError:
+        pass
 
 
 def validate_date(date_str: str) -> bool:
     """Validate date string format (YYYY-MM-DD)."""
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True
-    except ValueError:
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
         return False
+    year, month, day = (int(part) for part in match.groups())
+    return year >= 1 and day <= calendar.monthrange(year, month)[1]
+
+
+def _wait_for_request_slot() -> None:
+    """Block until the sliding window allows another request."""
+    with _rate_lock:
+        while True:
+            now = time.monotonic()
+            while _request_times and now - _request_times[0] >= RATE_LIMIT_WINDOW:
+                _request_times.popleft()
+            if len(_request_times) < RATE_LIMIT_REQUESTS:
+                _request_times.append(now)
+                return
+            time.sleep(RATE_LIMIT_WINDOW - (now - _request_times[0]))
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Return the Retry-After delay in seconds, if the server sent one."""
+    try:
+        return max(float(response.headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limited_get(url: str, **kwargs) -> requests.Response:
+    """GET through SESSION, staying under the API's rate limit and backing off on 429."""
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        _wait_for_request_slot()
+        response = SESSION.get(url, **kwargs)
+        if response.status_code == 429 and attempt < RATE_LIMIT_RETRIES:
+            delay = _retry_after(response)
+            time.sleep(delay if delay is not None else 2 ** attempt * 0.5)
+            continue
+
+        remaining = response.headers.get("X-RateLimit-Remaining", "")
+        if remaining.isdigit() and int(remaining) <= RATE_LIMIT_LOW_WATER:
+            delay = _retry_after(response)
+            time.sleep(delay if delay is not None else RATE_LIMIT_WINDOW)
+        return response
+
+
+def _prime_court_cache() -> None:
+    """Load every court's name into court_cache using the bulk courts endpoint."""
+    global _courts_primed
+    if _courts_primed:
+        return
+    _courts_primed = True
+
+    url = f"{API_BASE}/courts/"
+    params = {"page_size": 1000}
+    try:
+        while url:
+            response = _rate_limited_get(url, params=params, timeout=10)
+            response.raise_for_status()
+            data = json_loads(response.content)
+            for court in data.get("results", []):
+                ref = court.get("resource_uri", "").replace(CL_BASE, "", 1)
+                if ref and court.get("full_name"):
+                    _cache_court(ref, court["full_name"])
+                    court_fetch_info[ref] = (None, time.time())
+                    stale_courts.pop(ref, None)
+            url = data.get("next")
+            params = None
+    except (requests.RequestException, ValueError) as e:
+        console.print(f"Failed to fetch court list: {e}")
+
+
+def _can_revalidate(court_ref: str) -> bool:
+    """Return True if a stale court entry has an ETag for a conditional GET."""
+    return court_ref in stale_courts and bool(court_fetch_info.get(court_ref, (None, 0))[0])
 
 
 def resolve_court_name(court_ref: Union[str, dict]) -> str:
     """Resolve court name from a reference (URL or dict)."""
-    if isinstance(court_ref, dict):
+    cls = court_ref.__class__
+    if cls is dict:
         return court_ref.get("name", "Unknown Court")
 
-    if isinstance(court_ref, str) and court_ref.startswith("/api/"):
+    if cls is str and court_ref.startswith("/api/"):
+        if court_ref not in court_cache:
+            load_court_cache()
         if court_ref in court_cache:
+            court_cache.move_to_end(court_ref)
             return court_cache[court_ref]
-
-        court_url = f"https://www.courtlistener.com{court_ref}"
-        try:
-            response = requests.get(court_url, headers=HEADERS, timeout=10)
-            response.raise_for_status()
-            name = response.json().get("name", court_ref.split("/")[-2])
-            court_cache[court_ref] = name
-            return name
-        except requests.RequestException as e:
-            console.print(f"Failed to fetch court name: {e}")
-            return court_ref.split("/")[-2]
+        if _can_revalidate(court_ref):
+            return _fetch_court_name(court_ref)
+        _prime_court_cache()
+        if court_ref in court_cache:
+            return court_cache[court_ref]
+        return _fetch_court_name(court_ref)
 
     return court_ref or "Unknown Court"
 
 
+def _fetch_court_name(court_ref: str) -> str:
+    """Fetch a court's name from the API and cache it.
+
+    Stale entries are revalidated with If-None-Match; a 304 keeps the stored
+    name and only refreshes its timestamp.
+    """
+    court_url = CL_BASE + court_ref
+    etag = court_fetch_info.get(court_ref, (None, 0))[0]
+    headers = {"If-None-Match": etag} if etag and court_ref in stale_courts else None
+    try:
+        response = _rate_limited_get(court_url, headers=headers, timeout=10)
+        response.raise_for_status()
+        if response.status_code == 304:
+            name = stale_courts.get(court_ref, court_ref.split("/")[-2])
+        else:
+            name = json_loads(response.content).get("name", court_ref.split("/")[-2])
+            etag = response.headers.get("ETag")
+        _cache_court(court_ref, name)
+        court_fetch_info[court_ref] = (etag, time.time())
+        stale_courts.pop(court_ref, None)
+        return name
+    except (requests.RequestException, ValueError) as e:
+        console.print(f"Failed to fetch court name: {e}")
+        return stale_courts.get(court_ref, court_ref.split("/")[-2])
+
+
+def _is_uncached_ref(court_ref) -> bool:
+    """Return True if court_ref is an API reference whose name is not cached."""
+    if not isinstance(court_ref, str) or not court_ref.startswith("/api/") or court_ref in court_cache:
+        return False
+    load_court_cache()
+    return court_ref not in court_cache
+
+
+def prefetch_court_names(results: List[Dict]) -> None:
+    """Resolve every uncached court reference in results concurrently."""
+    refs = {item["court"] for item in results if _is_uncached_ref(item.get("court"))}
+    if not refs:
+        return
+    if any(not _can_revalidate(ref) for ref in refs):
+        _prime_court_cache()
+    refs = {ref for ref in refs if ref not in court_cache}
+    if not refs:
+        return
+    with ThreadPoolExecutor(max_workers=COURT_LOOKUP_WORKERS) as executor:
+        list(executor.map(_fetch_court_name, refs))
+
+
 def list_popular_courts() -> None:
     """Display a table of popular court slugs and their full names."""
     popular = [
@@ -80,12 +325,37 @@ def list_popular_courts() -> None:
     console.print(table)
 
 
-def fetch_opinions(url: str, params: Dict[str, Union[str, int]]) -> List[Dict]:
-    """Fetch opinions from the CourtListener API."""
+def _fetch_page(url: str, params: Optional[Dict[str, Union[str, int]]]) -> Dict:
+    """Fetch and decode one page of API results."""
+    response = _rate_limited_get(url, params=params, timeout=10)
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+def fetch_opinions(
+    url: str, params: Dict[str, Union[str, int]], max_results: int
+) -> Iterator[Dict]:
+    """Yield up to max_results opinions, following the API's pagination.
+
+    The next page is requested in the background while the current one is
+    being consumed.
+    """
+    yielded = 0
     try:
-        response = requests.get(url, headers=HEADERS, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json().get("results", [])
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(_fetch_page, url, params)
+            while pending is not None:
+                data = pending.result()
+                page_results = data.get("results", [])
+                next_url = data.get("next")
+                pending = None
+                if next_url and yielded + len(page_results) < max_results:
+                    pending = executor.submit(_fetch_page, next_url, None)
+                for item in page_results:
+                    yield item
+                    yielded += 1
+                    if yielded >= max_results:
+                        return
     except requests.ConnectionError:
         console.print("Connection error: Unable to reach the API.")
         sys.exit(1)
@@ -95,68 +365,198 @@ def fetch_opinions(url: str, params: Dict[str, Union[str, int]]) -> List[Dict]:
     except requests.HTTPError as e:
         console.print(f"HTTP error: {e.response.status_code} - {e.response.reason}")
         sys.exit(1)
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
         console.print(f"API error: {e}")
         sys.exit(1)
 
 
-def export_to_csv(results: List[Dict], filename: str) -> None:
-    """Export opinion results to a CSV file."""
-    try:
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["case_name", "court", "date_filed", "url", "docket_number", "citation"],
-                extrasaction="ignore",
-            )
-            writer.writeheader()
-            for item in results:
-                court = resolve_court_name(item.get("court"))
-                absolute_url = item.get("absolute_url", "")
-                url = f"https://www.courtlistener.com{absolute_url}"
-                writer.writerow({
-                    "case_name": item.get("case_name", "Unknown Case"),
-                    "court": court,
-                    "date_filed": item.get("date_filed", "Unknown Date"),
-                    "url": url,
-                    "docket_number": item.get("docket_number", ""),
-                    "citation": item.get("citation", ""),
-                })
-        console.print(f"Results exported to {filename}")
-    except IOError as e:
-        console.print(f"Error writing to CSV: {e}")
-        sys.exit(1)
+def _iter_rows(items: Iterable[Dict], court_slug: str = "") -> Iterator[Dict]:
+    """Yield display/export rows, resolving each page's courts together.
+
+    When results were filtered to a single court slug, rows whose court is an
+    uncached API reference use that court's name, resolved once, instead of a
+    lookup each. Rows that already carry a name keep it.
+    """
+    slug_ref = f"/api/rest/v4/courts/{court_slug}/" if court_slug and " " not in court_slug else None
+    single_court = None
+    names: Dict[str, str] = {}
+    items = iter(items)
+    while True:
+        batch = list(islice(items, MAX_PAGE_SIZE))
+        if not batch:
+            return
+        if slug_ref is not None and any(_is_uncached_ref(item.get("court")) for item in batch):
+            names[slug_ref] = resolve_court_name(slug_ref)
+            single_court = court_cache.get(slug_ref)
+            slug_ref = None
+        if single_court is None:
+            prefetch_court_names([
+                item for item in batch
+                if _is_uncached_ref(item.get("court")) and item["court"] not in names
+            ])
+        for item in batch:
+            court_ref = item.get("court")
+            if court_ref.__class__ is str:
+                court = names.get(court_ref)
+                if court is None:
+                    if single_court is not None and _is_uncached_ref(court_ref):
+                        court = single_court
+                    else:
+                        court = resolve_court_name(court_ref)
+                    names[court_ref] = court
+            else:
+                court = resolve_court_name(court_ref)
+            yield {
+                "case_name": item.get("case_name", "Unknown Case"),
+                "court": court,
+                "date_filed": item.get("date_filed", "Unknown Date"),
+                "url": CL_BASE + (item.get("absolute_url") or ""),
+                "docket_number": item.get("docket_number", ""),
+                "citation": item.get("citation", ""),
+            }
+
+
+def _plain_entry(idx: int, row: Dict, verbose: bool) -> str:
+    """Format one row as plain text, for piped output."""
+    lines = [
+        f"{idx}. {row['case_name']}",
+        f"   Court: {row['court']}",
+        f"   Date: {row['date_filed']}",
+        f"   {row['url']}",
+    ]
+    if verbose:
+        lines.append(f"   Docket: {row['docket_number'] or 'N/A'}")
+        lines.append(f"   Citation: {row['citation'] or 'N/A'}")
+    lines.append("\n")
+    return "\n".join(lines)
+
+
+def _new_table(verbose: bool) -> Table:
+    """Create the Rich results table, with extra columns in verbose mode."""
+    table = Table(show_lines=verbose)
+    table.add_column("#", justify="right", no_wrap=True)
+    table.add_column("Case", style="bold cyan")
+    table.add_column("Court", style="magenta")
+    table.add_column("Date", style="yellow", no_wrap=True)
+    table.add_column("URL", style="blue underline", overflow="fold")
+    if verbose:
+        table.add_column("Docket", style="green")
+        table.add_column("Citation", style="green")
+    return table
+
+
+def process_stream(
+    items: Iterable[Dict],
+    *,
+    display: bool = True,
+    csv_writer=None,
+    verbose: bool = False,
+    court_slug: str = "",
+    query: str = "",
+) -> int:
+    """Build each row once and send it to the display and CSV sinks; return the row count.
+
+    Piped output is written as it arrives, followed by the result count. On a
+    terminal the Rich table is filled while streaming and printed at the end.
+    """
+    plain = display and not console.is_terminal
+    table = _new_table(verbose) if display and not plain else None
+    count = 0
+    for count, row in enumerate(_iter_rows(items, court_slug), start=1):
+        if csv_writer is not None:
+            try:
+                csv_writer.writerow(CSV_ROW(row))
+            except OSError as e:
+                _csv_error(e)
+        if plain:
+            sys.stdout.write(_plain_entry(count, row, verbose))
+        elif table is not None:
+            cells = [str(count), row["case_name"], row["court"], row["date_filed"], row["url"]]
+            if verbose:
+                cells.append(str(row["docket_number"] or "N/A"))
+                cells.append(str(row["citation"] or "N/A"))
+            table.add_row(*cells)
+
+    if not display:
+        return count
+    if not count:
+        console.print(f"No results found for: '{query}'")
+        return count
+    court_display = f" in {court_slug}" if court_slug else ""
+    header = f"Found {count} result(s) for: '{query}'{court_display}"
+    if plain:
+        sys.stdout.write(header + "\n")
+    else:
+        console.print(f"\n{header}\n")
+        console.print(table)
+    return count
 
 
-def display_opinions(
-    results: List[Dict], query: str = "", court_slug: str = "", verbose: bool = False
-) -> None:
-    """Display opinion results in a formatted manner."""
-    if not results:
-        console.print(f"No results found for: '{query}'")
-        return
+def _csv_error(e: OSError) -> None:
+    """Report a failed CSV write and exit."""
+    console.print(f"Error writing to CSV: {e}")
+    sys.exit(1)
 
-    court_display = f" in {court_slug}" if court_slug else ""
-    console.print(f"\nFound {len(results)} result(s) for: '{query}'{court_display}\n")
 
-    for idx, item in enumerate(results, start=1):
-        case_name = item.get("case_name", "Unknown Case")
-        court = resolve_court_name(item.get("court"))
-        date_filed = item.get("date_filed", "Unknown Date")
-        absolute_url = item.get("absolute_url", "")
-        link = f"https://www.courtlistener.com{absolute_url}"
+@contextmanager
+def _csv_export(filename: str) -> Iterator:
+    """Open filename for export and yield a csv.writer with the header written.
 
-        console.print(f"{idx}. {case_name}", style="bold cyan")
-        console.print(f"   Court: {court}", style="magenta")
-        console.print(f"   Date: {date_filed}", style="yellow")
-        console.print(f"   {link}", style="blue underline")
+    Failures to open or finish the file are reported through _csv_error. If
+    the caller fails first, the file is closed quietly and its error wins.
+    """
+    import csv
 
-        if verbose:
-            docket = item.get("docket_number", "N/A")
-            citation = item.get("citation", "N/A")
-            console.print(f"   Docket: {docket}", style="green")
-            console.print(f"   Citation: {citation}", style="green")
-        console.print()
+    try:
+        f = open(filename, "w", newline="", encoding="utf-8")
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+    except OSError as e:
+        _csv_error(e)
+    try:
+        yield writer
+    except BaseException:
+        try:
+            f.close()
+        except OSError:
+            pass
+        raise
+    try:
+        f.close()
+    except OSError as e:
+        _csv_error(e)
+
+
+def _stream_results(
+    search_url: str,
+    params: Dict,
+    max_results: int,
+    query: str,
+    court_slug: str = "",
+    export_file: Optional[str] = None,
+    verbose: bool = False,
+) -> None:
+    """Fetch, display and optionally export results in a single pass.
+
+    The export file is opened only once the first page has been fetched, so a
+    failed request does not leave an empty CSV behind.
+    """
+    items = fetch_opinions(search_url, params, max_results)
+    first = next(items, None)
+    if first is not None:
+        items = chain((first,), items)
+
+    with ExitStack() as stack:
+        csv_writer = stack.enter_context(_csv_export(export_file)) if export_file else None
+        process_stream(
+            items,
+            csv_writer=csv_writer,
+            verbose=verbose,
+            court_slug=court_slug,
+            query=query,
+        )
+    if export_file:
+        console.print(f"Results exported to {export_file}")
 
 
 def search_opinions(
@@ -173,7 +573,7 @@ def search_opinions(
     params = {
         "q": query,
         "type": "o",
-        "page_size": max_results,
+        "page_size": min(max_results, MAX_PAGE_SIZE),
     }
     if court_slug:
         params["court"] = court_slug
@@ -182,10 +582,7 @@ def search_opinions(
     if end_date:
         params["date_filed__lte"] = end_date
 
-    results = fetch_opinions(search_url, params)
-    display_opinions(results, query, court_slug, verbose)
-    if export_file:
-        export_to_csv(results, export_file)
+    _stream_results(search_url, params, max_results, query, court_slug, export_file, verbose)
 
 
 def fetch_current_opinions(
@@ -200,7 +597,7 @@ def fetch_current_opinions(
     today = datetime.now().strftime("%Y-%m-%d")
     search_url = f"{API_BASE}/opinions/"
     params = {
-        "page_size": max_results,
+        "page_size": min(max_results, MAX_PAGE_SIZE),
     }
     if court_slug:
         params["court__id"] = court_slug
@@ -211,15 +608,39 @@ def fetch_current_opinions(
     if end_date:
         params["date_filed__lte"] = end_date
 
-    results = fetch_opinions(search_url, params)
     query = f"opinions from {start_date or today} to {end_date or 'today'}"
-    display_opinions(results, query, court_slug, verbose)
-    if export_file:
-        export_to_csv(results, export_file)
-
-
-def parse_arguments() -> argparse.Namespace:
+    _stream_results(search_url, params, max_results, query, court_slug, export_file, verbose)
+
+
+def _fast_path_arguments() -> Optional[SimpleNamespace]:
+    """Build arguments for a bare query or --list-courts without loading argparse."""
+    argv = sys.argv[1:]
+    if len(argv) != 1:
+        return None
+    args = SimpleNamespace(
+        query=None,
+        limit=10,
+        court=None,
+        list_courts=False,
+        curr=False,
+        start_date=None,
+        end_date=None,
+        export=None,
+        verbose=False,
+    )
+    if argv[0] == "--list-courts":
+        args.list_courts = True
+        return args
+    if argv[0] and not argv[0].startswith("-"):
+        args.query = argv[0]
+        return args
+    return None
+
+
+def parse_arguments() -> "argparse.Namespace":
     """Parse command-line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="CourtListener CLI Search Tool")
     parser.add_argument("query", nargs="?", help="Search term (e.g., 'Perkins Coie')")
     parser.add_argument("--limit", type=int, default=10, help="Max number of results to return")
@@ -235,7 +656,7 @@ def parse_arguments() -> argparse.Namespace:
 
 def main() -> None:
     """Main entry point for the CLI tool."""
-    args = parse_arguments()
+    args = _fast_path_arguments() or parse_arguments()
 
     if args.limit <= 0:
         console.print("Error  Error: --limit must be a positive integer")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Generate the courts.json snapshot from the CourtListener courts API.
+
+The GUI seeds its court name cache from courts.json, so court columns can be
+filled in without a lookup per court. Run this script to create or refresh the
+snapshot rather than editing the file by hand:
+
+    python3 update_courts.py --token <your API token>
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict
+
+import requests
+
+CL_BASE = "https://www.courtlistener.com"
+API_BASE = CL_BASE + "/api/rest/v4"
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "courts.json")
+
+
+def fetch_courts(token: str) -> Dict[str, str]:
+    """Return every court's API reference mapped to its full name."""
+    session = requests.Session()
+    session.headers["User-Agent"] = "CourtListenerGUI/1.0"
+    if token:
+        session.headers["Authorization"] = f"Token {token}"
+
+    courts = {}
+    url = f"{API_BASE}/courts/"
+    params = {"page_size": 1000}
+    while url:
+        response = session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        for court in data.get("results", []):
+            ref = court.get("resource_uri", "").replace(CL_BASE, "", 1)
+            name = court.get("full_name") or court.get("short_name")
+            if ref and name:
+                courts[ref] = name
+        url = data.get("next")
+        params = None
+    return courts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the courts.json snapshot")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("COURTLISTENER_API_TOKEN", ""),
+        help="CourtListener API token (default: $COURTLISTENER_API_TOKEN)",
+    )
+    parser.add_argument("--output", default=SNAPSHOT_PATH, help="Where to write the snapshot")
+    args = parser.parse_args()
+
+    try:
+        courts = fetch_courts(args.token)
+    except (requests.RequestException, ValueError) as e:
+        print(f"Failed to fetch court list: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not courts:
+        print("The API returned no courts; leaving the snapshot unchanged.", file=sys.stderr)
+        sys.exit(1)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(courts.items())), f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    print(f"Wrote {len(courts)} courts to {args.output}")
+
+
+if __name__ == "__main__":
+    main()